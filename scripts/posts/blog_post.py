@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class BlogPost:
     title: str
     slug: str
@@ -17,3 +17,8 @@ class BlogPost:
     image_alt: str = ""
     series_title: Optional[str] = None
     series_order: Optional[int] = None
+    date_iso: str = field(default="", init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Frozen so date_iso cannot go stale by reassigning date
+        object.__setattr__(self, "date_iso", self.date.isoformat())
@@ -4,18 +4,21 @@ import argparse
 import json
 import pathlib
 import re
-from datetime import datetime
-from typing import Callable, Iterable, List, Optional
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional
 from urllib.parse import urlsplit, urlunsplit
 
-import requests
-from rich.console import Console
-from rich.theme import Theme
+import tomli_w
 
 from .blog_post import BlogPost
 
-console = Console(theme=Theme(
-    {"prompt": "bold cyan", "choice": "bold green", "error": "bold red"}))
+if TYPE_CHECKING:
+    import requests
+    from rich.console import Console
 
 DEFAULT_MEDIUM_FEED = "https://medium.com/feed/@yrizos"
 DEFAULT_DEVTO_FEED = "https://dev.to/feed/yrizos"
@@ -26,11 +29,56 @@ POSTS_DIR = BLOG_DIR / "content/writing"
 IMAGES_DIR = BLOG_DIR / "assets/images/writing"
 WEB_IMAGE_PREFIX = pathlib.Path("images/writing")
 
+CONTENT_ENCODED_TAG = "{http://purl.org/rss/1.0/modules/content/}encoded"
+MEDIA_THUMBNAIL_TAG = "{http://search.yahoo.com/mrss/}thumbnail"
+ATOM_UPDATED_TAG = "{http://www.w3.org/2005/Atom}updated"
+
+SLUG_STRIP_PATTERN = re.compile(r"[^\w\s-]", re.UNICODE)
+SLUG_COLLAPSE_PATTERN = re.compile(r"[\s_-]+")
+
+MAX_WORKERS = 8
+
+# rich and requests are slow to import, so both singletons are created on
+# first use to keep `--help` fast
+_CONSOLE: Optional["Console"] = None
+_SESSION: Optional["requests.Session"] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_console() -> "Console":
+    """Return the shared Rich console, creating it on first use."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+        from rich.theme import Theme
+
+        _CONSOLE = Console(theme=Theme(
+            {"prompt": "bold cyan", "choice": "bold green", "error": "bold red"}))
+    return _CONSOLE
+
+
+def get_session() -> "requests.Session":
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            # Pooled keep-alive connections are reused by concurrent requests
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(
+                pool_connections=16, pool_maxsize=16))
+            session.mount("http://", HTTPAdapter(
+                pool_connections=16, pool_maxsize=16))
+            _SESSION = session
+    return _SESSION
+
 
 def slugify(title: str) -> str:
     """Convert a title into a filesystem-friendly slug."""
-    normalized = re.sub(r"[^\w\s-]", "", title, flags=re.UNICODE)
-    collapsed = re.sub(r"[\s_-]+", "-", normalized.strip().lower())
+    normalized = SLUG_STRIP_PATTERN.sub("", title)
+    collapsed = SLUG_COLLAPSE_PATTERN.sub("-", normalized.strip().lower())
     return collapsed or "post"
 
 
@@ -40,11 +88,67 @@ def clean_url(url: str) -> str:
     return urlunsplit((split.scheme, split.netloc, split.path, "", ""))
 
 
+def find_text(element, path: str) -> Optional[str]:
+    """Return the stripped text of a child element, or None if missing or empty."""
+    text = element.findtext(path)
+    if text is None:
+        return None
+    return text.strip() or None
+
+
+def extract_tags(entry) -> List[str]:
+    """Extract tag terms from a feed entry."""
+    terms = (
+        tag.get("term") if isinstance(tag, dict) else getattr(tag, "term", None)
+        for tag in entry.get("tags", [])
+    )
+    normalized = (str(term).strip() for term in terms if term)
+    # dict.fromkeys dedupes while preserving first-seen order
+    return list(dict.fromkeys(tag for tag in normalized if tag))
+
+
+def parse_feed_item(item) -> dict:
+    """Convert an RSS <item> element into a feedparser-style entry dict."""
+    return {
+        "title": find_text(item, "title"),
+        "link": find_text(item, "link"),
+        "published": find_text(item, "pubDate"),
+        "updated": find_text(item, ATOM_UPDATED_TAG),
+        "content": find_text(item, CONTENT_ENCODED_TAG),
+        "summary": find_text(item, "description"),
+        "tags": [
+            {"term": category.text}
+            for category in item.iterfind("category")
+            if category.text
+        ],
+        "media_thumbnail": [
+            dict(thumbnail.attrib) for thumbnail in item.iterfind(MEDIA_THUMBNAIL_TAG)
+        ],
+    }
+
+
+def iter_feed_entries(feed_url: str) -> Iterator[dict]:
+    """Stream entries from an RSS feed as they are downloaded."""
+    from lxml import etree
+
+    with get_session().get(feed_url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        context = etree.iterparse(
+            response.raw, events=("end",), tag="item")
+        try:
+            for _, item in context:
+                yield parse_feed_item(item)
+                # Drop processed items so the tree stays small
+                item.clear()
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
+        except etree.XMLSyntaxError as err:
+            raise ValueError(f"Failed to parse feed '{feed_url}': {err}") from err
+
+
 def parse_publish_date(raw_value: Optional[str], fallback: Optional[str], title: str) -> datetime:
     """Parse publication date from the feed entry."""
-    from datetime import timezone
-    from email.utils import parsedate_to_datetime
-
     value = raw_value or fallback
     if not value:
         raise ValueError(f"Post '{title}' is missing a publish date.")
@@ -58,7 +162,7 @@ def build_front_matter(post: BlogPost, image_web_path: Optional[pathlib.Path]) -
     """Create TOML front matter for the Hugo post."""
     fields = {
         "title": post.title,
-        "date": post.date.isoformat(),
+        "date": post.date_iso,
         "draft": False,
         "type": "posts",
         "canonical_url": post.original_url,
@@ -66,38 +170,37 @@ def build_front_matter(post: BlogPost, image_web_path: Optional[pathlib.Path]) -
     if image_web_path:
         fields["image"] = image_web_path.as_posix()
         fields["imageAlt"] = post.image_alt or ""
+    front_matter = tomli_w.dumps(fields)
     if post.tags:
-        fields["tags"] = post.tags
+        # tomli_w always splits arrays across lines; keep tags inline like
+        # existing posts (JSON string escapes are valid in TOML)
+        front_matter += f"tags = {json.dumps(post.tags, ensure_ascii=False)}\n"
+
+    series_fields = {}
     if post.series_title:
-        fields["series_title"] = post.series_title
+        series_fields["series_title"] = post.series_title
     if post.series_order:
-        fields["series_order"] = post.series_order
+        series_fields["series_order"] = post.series_order
+    front_matter += tomli_w.dumps(series_fields)
 
-    lines = ["+++"]
-    for key, value in fields.items():
-        lines.append(f"{key} = {to_toml_value(value)}")
-    lines.append("+++")
-    return "\n".join(lines)
-
-
-def to_toml_value(value) -> str:
-    """Serialize a Python value into a TOML-compatible string."""
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    if isinstance(value, datetime):
-        return value.isoformat()
-    if isinstance(value, (int, float)):
-        return str(value)
-    return json.dumps(value)
+    return f"+++\n{front_matter}+++"
 
 
 def download_image(url: str, destination: pathlib.Path) -> None:
     """Download the image for the post."""
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    with destination.open("wb") as handle:
-        handle.write(response.content)
+    with get_session().get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a sibling temp file so a failed download leaves no partial image
+        partial = destination.with_name(f"{destination.name}.part")
+        try:
+            with partial.open("wb") as handle:
+                shutil.copyfileobj(response.raw, handle, length=65536)
+            partial.replace(destination)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
 
 
 def determine_image_filename(slug: str, image_url: str) -> str:
@@ -128,11 +231,11 @@ def write_post(post: BlogPost) -> None:
 
 def prompt_for_post(post: BlogPost) -> str:
     """Prompt the user whether to import a specific post."""
-    console.print(
+    get_console().print(
         f"\n[choice]{post.title}[/choice]\n  Published: {post.date.strftime('%Y-%m-%d')}\n  URL: {post.original_url}"
     )
     while True:
-        decision = console.input(
+        decision = get_console().input(
             "[prompt]Import this post? (yes/no/exit): [/prompt]").strip().lower()
         if decision in {"yes", "y"}:
             return "yes"
@@ -140,32 +243,42 @@ def prompt_for_post(post: BlogPost) -> str:
             return "no"
         if decision in {"exit", "e"}:
             return "exit"
-        console.print(
+        get_console().print(
             "Please answer with 'yes', 'no', or 'exit'.", style="error")
 
 
 def process_posts(posts: Iterable[BlogPost]) -> None:
-    """Iterate through posts, prompting the user before writing each one."""
+    """Prompt the user for each post, then write the approved ones concurrently."""
+    approved: List[BlogPost] = []
     for post in posts:
         decision = prompt_for_post(post)
         if decision == "exit":
             break
         if decision == "no":
-            console.print(f"Skipping: {post.title}", style="choice")
+            get_console().print(f"Skipping: {post.title}", style="choice")
             continue
-        try:
-            write_post(post)
-            console.print(f"[green]Saved:[/green] {post.title}")
-        except Exception as err:  # noqa: BLE001
-            console.print(
-                f"Failed to save '{post.title}': {err}", style="error")
+        approved.append(post)
+
+    if not approved:
+        return
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(write_post, post): post for post in approved}
+        for future in as_completed(futures):
+            post = futures[future]
+            try:
+                future.result()
+                get_console().print(f"[green]Saved:[/green] {post.title}")
+            except Exception as err:  # noqa: BLE001
+                get_console().print(
+                    f"Failed to save '{post.title}': {err}", style="error")
 
 
 def run(feed_fetcher: Callable[[str], List[BlogPost]], feed_url: str) -> None:
     """Fetch posts from the selected feed and process them."""
     posts = feed_fetcher(feed_url)
     if not posts:
-        console.print("No posts found to process.", style="error")
+        get_console().print("No posts found to process.", style="error")
         return
     process_posts(posts)
 
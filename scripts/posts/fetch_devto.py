@@ -1,20 +1,35 @@
 """Dev.to-specific post fetching logic."""
 
-from typing import List, Optional
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, List, Optional
 from urllib.parse import urlsplit
 
-import feedparser
-import requests
-from rich.console import Console
-from rich.theme import Theme
+import orjson
+from lxml import etree
 
 from .blog_post import BlogPost
-from .cli import clean_url, parse_publish_date, slugify
-
-console = Console(theme=Theme(
-    {"prompt": "bold cyan", "choice": "bold green", "error": "bold red"}))
+from .cli import (
+    MAX_WORKERS,
+    clean_url,
+    extract_tags,
+    get_console,
+    get_session,
+    iter_feed_entries,
+    parse_publish_date,
+    slugify,
+)
 
 DEVTO_SKIP_SLUGS = {"building-a-chess-game-with-python-and-openai-3knn"}
+# Matches the "Series' Articles - DEV Community" suffix (handles ' or &#39;)
+SERIES_SUFFIX_PATTERN = re.compile(
+    r"\s+Series['\u2019]?\s+Articles\s*-\s*DEV Community.*$")
+
+# Serialize the first fetches so parallel entries share one cached request
+_USER_ARTICLES_LOCK = threading.Lock()
+_SERIES_TITLE_LOCK = threading.Lock()
 
 
 def extract_devto_article_id(url: str) -> Optional[str]:
@@ -34,59 +49,104 @@ def extract_devto_article_id(url: str) -> Optional[str]:
 def fetch_devto_article(article_id: str) -> dict:
     """Fetch article data from the Dev.to API."""
     api_url = f"https://dev.to/api/articles/{article_id}"
-    response = requests.get(api_url, timeout=30)
+    response = get_session().get(api_url, timeout=30)
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
+
+
+class _TitleTarget:
+    """lxml parser target that collects the text of the first <title> element."""
+
+    def __init__(self) -> None:
+        self.parts: List[str] = []
+        self.in_title = False
+        self.done = False
+
+    def start(self, tag, attrib) -> None:
+        if tag == "title" and not self.done:
+            self.in_title = True
+
+    def end(self, tag) -> None:
+        if tag == "title" and self.in_title:
+            self.in_title = False
+            self.done = True
+
+    def data(self, data) -> None:
+        if self.in_title:
+            self.parts.append(data)
+
+    def close(self) -> str:
+        return "".join(self.parts)
+
+
+@lru_cache(maxsize=None)
+def _fetch_series_page_title(username: str, collection_id: int) -> Optional[str]:
+    """Fetch the <title> of a Dev.to series page, cached per series."""
+    series_url = f"https://dev.to/{username}/series/{collection_id}"
+    target = _TitleTarget()
+    # Stream the page and stop reading once </title> has been parsed
+    with get_session().get(series_url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        # Decode with the HTTP charset; <meta charset> may come after <title>
+        parser = etree.HTMLParser(
+            target=target, encoding=response.encoding or "utf-8")
+        for chunk in response.iter_content(chunk_size=4096):
+            parser.feed(chunk)
+            if target.done:
+                break
+    # The parser already decodes HTML entities (e.g., &#39; -> ')
+    title = parser.close()
+    if title:
+        title = SERIES_SUFFIX_PATTERN.sub("", title)
+        return title.strip()
+    return None
 
 
 def fetch_series_title(username: str, collection_id: int) -> Optional[str]:
     """Fetch series title from the Dev.to series page."""
     try:
-        series_url = f"https://dev.to/{username}/series/{collection_id}"
-        response = requests.get(series_url, timeout=30)
-        response.raise_for_status()
-
-        # Extract title from HTML <title> tag
-        import re
-        import html
-        match = re.search(r'<title>(.+?)</title>', response.text)
-        if match:
-            title = match.group(1)
-            # Decode HTML entities (e.g., &#39; -> ')
-            title = html.unescape(title)
-            # Remove "Series' Articles - DEV Community" suffix (handles ' or &#39;)
-            title = re.sub(r"\s+Series['\u2019]?\s+Articles\s*-\s*DEV Community.*$", "", title)
-            return title.strip()
+        with _SERIES_TITLE_LOCK:
+            return _fetch_series_page_title(username, collection_id)
     except Exception:
-        # If we can't fetch series title, just return None
-        pass
-    return None
+        # If we can't fetch series title, just return None; failures are
+        # not cached, so the next entry in the series retries
+        return None
+
+
+@lru_cache(maxsize=8)
+def _fetch_user_articles(username: str) -> list:
+    """Fetch all articles for a user, cached since every series entry needs the same list."""
+    api_url = f"https://dev.to/api/articles?username={username}&per_page=1000"
+    response = get_session().get(api_url, timeout=30)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+@lru_cache(maxsize=None)
+def _series_positions(username: str, collection_id: int) -> Dict[int, int]:
+    """Map article IDs in a series to their 1-based position by publish date."""
+    with _USER_ARTICLES_LOCK:
+        articles = _fetch_user_articles(username)
+
+    # Filter articles by collection_id and sort by published_at
+    series_articles = [
+        a for a in articles
+        if a.get("collection_id") == collection_id
+    ]
+    series_articles.sort(key=lambda x: x.get("published_at", ""))
+    return {
+        article.get("id"): index
+        for index, article in enumerate(series_articles, start=1)
+    }
 
 
 def calculate_series_order(username: str, collection_id: int, article_id: int) -> Optional[int]:
     """Calculate the article's position in the series based on publish date."""
     try:
-        # Fetch all articles for the user
-        api_url = f"https://dev.to/api/articles?username={username}&per_page=1000"
-        response = requests.get(api_url, timeout=30)
-        response.raise_for_status()
-        articles = response.json()
-
-        # Filter articles by collection_id and sort by published_at
-        series_articles = [
-            a for a in articles
-            if a.get("collection_id") == collection_id
-        ]
-        series_articles.sort(key=lambda x: x.get("published_at", ""))
-
-        # Find the position of the current article
-        for index, article in enumerate(series_articles, start=1):
-            if article.get("id") == article_id:
-                return index
+        return _series_positions(username, collection_id).get(article_id)
     except Exception:
         # If we can't determine order, return None
-        pass
-    return None
+        return None
 
 
 def extract_devto_slug(entry) -> Optional[str]:
@@ -103,50 +163,39 @@ def extract_devto_slug(entry) -> Optional[str]:
     return parts[-1]
 
 
-def extract_tags(entry) -> List[str]:
-    """Extract tag terms from a feed entry."""
-    tags: List[str] = []
-    seen = set()
-    for tag in entry.get("tags", []):
-        term = tag.get("term") if isinstance(
-            tag, dict) else getattr(tag, "term", None)
-        if not term:
-            continue
-        normalized = str(term).strip()
-        if not normalized or normalized in seen:
-            continue
-        seen.add(normalized)
-        tags.append(normalized)
-    return tags
-
-
 def fetch_devto_posts(feed_url: str) -> List[BlogPost]:
     """Fetch Dev.to posts using the RSS feed."""
-    parsed = feedparser.parse(feed_url)
-    if parsed.bozo:
-        raise ValueError(
-            f"Failed to parse Dev.to feed: {parsed.bozo_exception}")
-
-    posts: List[BlogPost] = []
-    for entry in parsed.entries:
-        title = entry.get("title")
-        if not title:
-            console.print("Skipping entry without a title.", style="error")
-            continue
-        entry_slug = extract_devto_slug(entry)
-        if entry_slug and entry_slug in DEVTO_SKIP_SLUGS:
-            continue
-        try:
-            posts.append(parse_devto_entry(entry))
-        except ValueError as err:
-            console.print(
-                f"Skipping Dev.to entry '{title}': {err}", style="error")
-    return posts
+    entries = []
+    results: Dict[int, BlogPost] = {}
+    # Each entry needs its own API round-trips, so fetch them concurrently
+    # while the rest of the feed is still streaming in
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for entry in iter_feed_entries(feed_url):
+            title = entry.get("title")
+            if not title:
+                get_console().print("Skipping entry without a title.", style="error")
+                continue
+            entry_slug = extract_devto_slug(entry)
+            if entry_slug and entry_slug in DEVTO_SKIP_SLUGS:
+                continue
+            futures[executor.submit(parse_devto_entry, entry)] = len(entries)
+            entries.append(entry)
+
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except ValueError as err:
+                get_console().print(
+                    f"Skipping Dev.to entry '{entries[index]['title']}': {err}", style="error")
+    # Keep feed order so prompts follow the original sequence
+    return [results[index] for index in sorted(results)]
 
 
 def parse_devto_entry(entry) -> BlogPost:
     """Transform a Dev.to feed entry into a BlogPost using the Dev.to API."""
-    title: str = entry.title
+    title: str = entry["title"]
     slug = slugify(title)
 
     published = parse_publish_date(